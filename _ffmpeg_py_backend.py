@@ -0,0 +1,61 @@
+"""ffmpeg-python fallback for ffCropper, imported only when system ffmpeg cannot be used."""
+import functools
+import logging
+import subprocess
+
+try:
+    import ffmpeg
+except ImportError:
+    ffmpeg = None
+
+logger = logging.getLogger('ffCropper')
+
+@functools.lru_cache(maxsize=1)
+def probe_works():
+    """Check once whether ffprobe, which ffmpeg-python's probe relies on, runs on a tiny generated input.
+    
+    ffprobe is run directly because the released ffmpeg-python.probe() has no timeout;
+    subprocess.run kills it if it hangs for more than a second.
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-f', 'lavfi', 'nullsrc=s=16x16:d=0.04'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=1
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+def run_copy(source, in_seconds, duration, output_path, check=True):
+    """Stream-copy a clip with ffmpeg-python, optionally checking ffprobe access first."""
+    try:
+        logger.info("Trying ffmpeg-python library")
+        
+        # Debug output path
+        logger.info("Output path for ffmpeg-python: %s", output_path)
+        
+        if check and not probe_works():
+            logger.error("ffmpeg-python test failed")
+            logger.error("ERROR: This suggests ffmpeg is not properly installed or not accessible.")
+            logger.info("Please install FFMPEG as described above.")
+            return False
+        
+        (
+            ffmpeg
+            .input(source, ss=in_seconds)
+            .output(output_path, t=duration, c='copy')
+            # Parallel workers must not compete for the terminal or write to it directly
+            .global_args('-hide_banner', '-loglevel', 'error', '-nostdin')
+            .overwrite_output()
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+        logger.info("Successfully processed (using ffmpeg-python): %s -> %s", source, output_path)
+        return True
+    except ffmpeg.Error as e:
+        logger.error("%s", e.stderr.decode('utf-8', errors='replace').strip())
+        logger.error("ffmpeg-python error: %s", e)
+        return False
+    except Exception as e:
+        logger.error("ffmpeg-python error: %s", e)
+        return False
@@ -1,26 +1,99 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import json
+import logging
+import logging.handlers
 import os
+import pathlib
+import queue
+import shlex
 import subprocess
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Try to import ffmpeg-python as a fallback
+# Use orjson for faster config parsing when installed
 try:
-    import ffmpeg
-    HAVE_FFMPEG_PYTHON = True
+    import orjson
+    HAVE_ORJSON = True
 except ImportError:
-    HAVE_FFMPEG_PYTHON = False
+    HAVE_ORJSON = False
+
+logger = logging.getLogger('ffCropper')
+
+# Keys every video config must provide
+REQUIRED_KEYS = frozenset(('source', 'in', 'out', 'output'))
+
+# Most clips cut by one grouped ffmpeg process; each clip opens the source as a
+# separate input, so this bounds open files and the command-line length
+_MAX_CLIPS_PER_PROCESS = 8
+
+# Timestamped output paths already generated during this run, shared by batch workers
+_claimed_output_paths = set()
+_claimed_output_paths_lock = threading.Lock()
+
+# Fixed ffmpeg arguments shared by every command
+_FFMPEG_PREFIX = (
+    'ffmpeg',
+    '-hide_banner',
+    '-loglevel', 'error',
+    '-nostdin',  # Never poll stdin for interactive commands
+    '-threads', '0',
+    '-y',  # Overwrite output files if they exist
+)
+_CODEC_COPY = (
+    '-c', 'copy',  # Copy streams without re-encoding for speed
+    '-avoid_negative_ts', '1',
+)
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_available(cmd='ffmpeg'):
+    """Check once per executable whether ffmpeg can be run."""
+    try:
+        result = subprocess.run([cmd, '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def _get_ffmpeg_py():
+    """Import the ffmpeg-python fallback on first use.
+    
+    Returns None if ffmpeg-python or the bundled _ffmpeg_py_backend.py is missing.
+    """
+    try:
+        import _ffmpeg_py_backend
+    except ImportError:
+        return None
+    return _ffmpeg_py_backend if _ffmpeg_py_backend.ffmpeg is not None else None
+
+def _launch_ffmpeg(cmd):
+    """Start an ffmpeg command without waiting, capturing its stderr."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Running command: %s', shlex.join(cmd))
+    return subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+def _wait_ffmpeg(process):
+    """Drain a launched ffmpeg's stderr and wait for it to exit.
+    
+    Raises subprocess.CalledProcessError if ffmpeg exits with a non-zero code.
+    """
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        logger.error(stderr.decode('utf-8', errors='replace').strip())
+        raise subprocess.CalledProcessError(process.returncode, process.args, stderr=stderr)
 
 def parse_timestamp(timestamp):
     """Convert HHMMSS timestamp to seconds."""
     if not timestamp.isdigit() or len(timestamp) != 6:
         raise ValueError(f"Invalid timestamp: {timestamp}. Must be in HHMMSS format (6 digits)")
     
-    hours = int(timestamp[0:2])
-    minutes = int(timestamp[2:4])
-    seconds = int(timestamp[4:6])
+    # Split the digits arithmetically rather than slicing the string
+    hours, rest = divmod(int(timestamp), 10000)
+    minutes, seconds = divmod(rest, 100)
     
     if hours > 23 or minutes > 59 or seconds > 59:
         raise ValueError(f"Invalid time values in timestamp: {timestamp}")
@@ -28,39 +101,64 @@ def parse_timestamp(timestamp):
     total_seconds = hours * 3600 + minutes * 60 + seconds
     return total_seconds
 
+def _claim_output_path(output_path):
+    """Return output_path, numbered if this run has already generated the same path."""
+    root, ext = os.path.splitext(output_path)
+    candidate = output_path
+    counter = 1
+    with _claimed_output_paths_lock:
+        while candidate in _claimed_output_paths:
+            candidate = f"{root}-{counter}{ext}"
+            counter += 1
+        _claimed_output_paths.add(candidate)
+    return candidate
+
 def format_output_filename(output_path, source_path):
     """Format the output filename with timestamp."""
-    # Normalize path separators to OS-specific format
-    output_path = os.path.normpath(output_path)
+    # Parse the path once; the suffix and trailing separator are reused below
+    output_suffix = pathlib.PurePath(output_path).suffix
+    ends_with_sep = output_path[-1:] in ('/', '\\', os.sep)
     
-    if '[timestamp]' in output_path:
-        # Add milliseconds to ensure uniqueness
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S%f')[:19]  # Include 3 digits of milliseconds
+    # Plain file paths need no timestamp, so skip straight to normalization
+    if '[timestamp]' not in output_path and not ends_with_sep and output_suffix:
+        output_path = os.path.normpath(output_path)
+        logger.info("Normalized output path: %s", output_path)
+        return output_path
+    
+    # Add milliseconds to ensure uniqueness
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S%f')[:19]  # Include 3 digits of milliseconds
+    
+    has_timestamp = '[timestamp]' in output_path
+    if has_timestamp:
         output_path = output_path.replace('[timestamp]', timestamp)
     
-    # Check if output path is a directory or ends with separator
-    if os.path.isdir(output_path) or output_path.endswith(os.sep) or (output_path.endswith('/') or output_path.endswith('\\')):
-        # Extract source filename components
-        source_basename = os.path.basename(source_path)
-        source_name, source_ext = os.path.splitext(source_basename)
-        # Add milliseconds to ensure uniqueness
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S%f')[:19]  # Include 3 digits of milliseconds
-        
-        # Combine directory path with formatted filename
-        output_path = os.path.join(output_path, f"{source_name}-{timestamp}{source_ext}")
+    # Check if output path ends with a separator or is an existing directory;
+    # paths with a file extension are taken as files without touching the filesystem
+    if ends_with_sep or (not output_suffix and os.path.isdir(output_path)):
+        # Combine directory path with a filename built from the source's components
+        source = pathlib.PurePath(source_path)
+        output_path = os.path.join(output_path, f"{source.stem}-{timestamp}{source.suffix}")
+        has_timestamp = True
     
     # Final normalization to ensure OS-compatible path
     output_path = os.path.normpath(output_path)
-    print(f"Normalized output path: {output_path}")
+    
+    # Timestamps can repeat within a millisecond, so keep generated names unique
+    if has_timestamp:
+        output_path = _claim_output_path(output_path)
+    logger.info("Normalized output path: %s", output_path)
     
     return output_path
 
-def process_video(source, in_timestamp, out_timestamp, output):
-    """Process a single video using ffmpeg."""
-    # Check if source file exists
-    if not os.path.exists(source):
-        raise FileNotFoundError(f"Source file not found: {source}")
-    
+def _check_source(source):
+    """Raise FileNotFoundError if the source file is missing, using a single stat call."""
+    try:
+        os.stat(source)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Source file not found: {source}") from None
+
+def _prepare_clip(source, in_timestamp, out_timestamp, output):
+    """Validate a clip's timestamps and return (in_seconds, duration, output_path)."""
     try:
         in_seconds = parse_timestamp(in_timestamp)
     except ValueError as e:
@@ -79,103 +177,154 @@ def process_video(source, in_timestamp, out_timestamp, output):
     # Format the output path
     output_path = format_output_filename(output, source)
     
-    # Ensure the output directory exists
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    return in_seconds, duration, output_path
+
+def process_video(source, in_timestamp, out_timestamp, output):
+    """Process a single video using ffmpeg."""
+    # Check if source file exists
+    _check_source(source)
+    
+    in_seconds, duration, output_path = _prepare_clip(source, in_timestamp, out_timestamp, output)
     
     # Check for ffmpeg installation before proceeding
-    ffmpeg_available = False
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        ffmpeg_available = result.returncode == 0
-    except Exception:
-        ffmpeg_available = False
-    
-    if not ffmpeg_available and not HAVE_FFMPEG_PYTHON:
-        print("\nERROR: FFMPEG is not installed or not in your system PATH.")
-        print("Please install FFMPEG to use this script:")
-        print("- Windows: Download from https://ffmpeg.org/download.html and add to PATH")
-        print("- macOS: Use Homebrew: brew install ffmpeg")
-        print("- Linux: Use your package manager, e.g., apt install ffmpeg\n")
-        print("Alternatively, you can specify the path to the ffmpeg executable using --ffmpeg-path")
+    ffmpeg_available = _ffmpeg_available('ffmpeg')
+    
+    if not ffmpeg_available and _get_ffmpeg_py() is None:
+        logger.error("\nERROR: FFMPEG is not installed or not in your system PATH.")
+        logger.info("Please install FFMPEG to use this script:")
+        logger.info("- Windows: Download from https://ffmpeg.org/download.html and add to PATH")
+        logger.info("- macOS: Use Homebrew: brew install ffmpeg")
+        logger.info("- Linux: Use your package manager, e.g., apt install ffmpeg\n")
+        logger.info("Alternatively, you can specify the path to the ffmpeg executable using --ffmpeg-path")
         return False
     
     # Create output directory
     output_dir = os.path.dirname(output_path)
     try:
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-            print(f"Created output directory: {output_dir}")
-    except Exception as e:
-        print(f"Error creating output directory: {e}")
+    except OSError as e:
+        logger.error("Error creating output directory: %s", e)
         return False
     
+    return _run_single(source, in_seconds, duration, output_path, ffmpeg_available)
+
+def _run_single(source, in_seconds, duration, output_path, ffmpeg_available):
+    """Cut one already-resolved clip with system ffmpeg, falling back to ffmpeg-python."""
     # Try using system ffmpeg if available
     if ffmpeg_available:
         try:
             cmd = [
-                'ffmpeg',
+                *_FFMPEG_PREFIX,
+                '-ss', str(in_seconds),  # Seek on the input using the keyframe index
                 '-i', source,
-                '-ss', str(in_seconds),
                 '-t', str(duration),
-                '-c', 'copy',  # Copy stream without re-encoding for speed
-                '-y',  # Overwrite output file if exists
+                *_CODEC_COPY,
                 output_path
             ]
             
-            print(f"Running command: {' '.join(cmd)}")
-            subprocess.run(cmd, check=True)
-            print(f"Successfully processed: {source} -> {output_path}")
+            _wait_ffmpeg(_launch_ffmpeg(cmd))
+            logger.info("Successfully processed: %s -> %s", source, output_path)
             return True
         except subprocess.SubprocessError as e:
-            print(f"Error processing with system ffmpeg: {e}")
+            logger.error("Error processing with system ffmpeg: %s", e)
             # Fall through to ffmpeg-python if available
     
-    # Try ffmpeg-python if available
-    if HAVE_FFMPEG_PYTHON:
+    # Try ffmpeg-python if available, testing it only when system ffmpeg could not be run at all
+    ffmpeg_py = _get_ffmpeg_py()
+    if ffmpeg_py is not None:
+        return ffmpeg_py.run_copy(source, in_seconds, duration, output_path, check=not ffmpeg_available)
+    
+    logger.error("Error: Both system ffmpeg and ffmpeg-python are unavailable")
+    return False
+
+def _process_clips_individually(source, clips):
+    """Run process_video for each clip, returning the number written successfully."""
+    success_count = 0
+    for clip in clips:
         try:
-            print(f"Trying ffmpeg-python library")
-            
-            # Debug output path
-            print(f"Output path for ffmpeg-python: {output_path}")
-            
-            try:
-                # Test if ffmpeg-python can actually run
-                try:
-                    print("Testing if ffmpeg-python can access ffmpeg...")
-                    ffmpeg.probe(source)
-                    print("ffmpeg-python can access ffmpeg")
-                except Exception as test_error:
-                    print(f"ffmpeg-python test failed: {test_error}")
-                    print("ERROR: This suggests ffmpeg is not properly installed or not accessible.")
-                    print("Please install FFMPEG as described above.")
-                    return False
-                
-                (
-                    ffmpeg
-                    .input(source, ss=in_seconds)
-                    .output(output_path, t=duration, c='copy')
-                    .overwrite_output()
-                    .run()
-                )
-                print(f"Successfully processed (using ffmpeg-python): {source} -> {output_path}")
-                return True
-            except Exception as fe:
-                print(f"ffmpeg-python error: {fe}")
-                return False
+            if process_video(source, clip['in'], clip['out'], clip['output']):
+                success_count += 1
         except Exception as e:
-            print(f"Error in ffmpeg-python processing: {e}")
-            return False
-    else:
-        print("Error: Both system ffmpeg and ffmpeg-python are unavailable")
-        return False
+            logger.error("Error processing clip %s from %s: %s", clip['output'], source, e)
+    return success_count
+
+def process_source_clips(source, clips):
+    """Cut several clips from one source in a single ffmpeg process.
+    
+    Returns the number of clips that were written successfully.
+    """
+    # Without system ffmpeg, fall back to processing each clip on its own
+    if not _ffmpeg_available('ffmpeg'):
+        return _process_clips_individually(source, clips)
+    
+    # Check if source file exists
+    _check_source(source)
+    
+    # One process with an input-seeked copy of the source per clip, each mapped to its own output
+    input_args = []
+    output_args = []
+    prepared_clips = []
+    for clip in clips:
+        try:
+            in_seconds, duration, output_path = _prepare_clip(source, clip['in'], clip['out'], clip['output'])
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+        except (ValueError, OSError) as e:
+            logger.warning("Skipping clip %s from %s: %s", clip['output'], source, e)
+            continue
+        
+        index = len(prepared_clips)
+        input_args += ['-ss', str(in_seconds), '-i', source]
+        # Mirror ffmpeg's default selection of one video and one audio stream;
+        # 'V' skips attached pictures such as cover art, and subtitles are not copied
+        output_args += [
+            '-map', f'{index}:V:0?',
+            '-map', f'{index}:a:0?',
+            '-t', str(duration),
+            *_CODEC_COPY,
+            output_path
+        ]
+        prepared_clips.append((in_seconds, duration, output_path))
+    
+    if not prepared_clips:
+        return 0
+    
+    cmd = [*_FFMPEG_PREFIX, *input_args, *output_args]
+    try:
+        _wait_ffmpeg(_launch_ffmpeg(cmd))
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.error("Error processing %s with system ffmpeg: %s", source, e)
+        # Retry one clip at a time into the same paths so a single bad clip doesn't fail the rest
+        logger.info("Retrying clips from %s individually", source)
+        success_count = 0
+        for in_seconds, duration, output_path in prepared_clips:
+            # Remove any partial output the grouped run left behind
+            try:
+                os.remove(output_path)
+            except FileNotFoundError:
+                pass
+            if _run_single(source, in_seconds, duration, output_path, True):
+                success_count += 1
+        return success_count
+    
+    for _, _, output_path in prepared_clips:
+        logger.info("Successfully processed: %s -> %s", source, output_path)
+    return len(prepared_clips)
+
+def _fixed_output_path(output):
+    """Return the normalized absolute path of an output that names one fixed file, else None."""
+    if '[timestamp]' in output or output[-1:] in ('/', '\\', os.sep) or os.path.isdir(output):
+        return None
+    return os.path.normcase(os.path.abspath(output))
 
-def process_batch(config_path):
-    """Process multiple videos defined in a config file."""
+def process_batch(config_path, jobs=None):
+    """Process multiple videos defined in a config file, running up to `jobs` at once."""
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        with open(config_path, 'rb') as f:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            config_data = orjson.loads(f.read()) if HAVE_ORJSON else json.load(f)
         
         # Handle different config formats
         configs = []
@@ -184,51 +333,116 @@ def process_batch(config_path):
             configs = config_data
         elif isinstance(config_data, dict):
             # Format might be a single config object
-            if all(key in config_data for key in ['source', 'in', 'out', 'output']):
+            if REQUIRED_KEYS.issubset(config_data):
                 configs = [config_data]
             else:
                 # Format might be {config1: {...}, config2: {...}, ...}
                 for key, value in config_data.items():
-                    if isinstance(value, dict) and all(k in value for k in ['source', 'in', 'out', 'output']):
+                    if isinstance(value, dict) and REQUIRED_KEYS.issubset(value):
                         configs.append(value)
         
         if not configs:
-            print("No valid configurations found in the config file")
+            logger.error("No valid configurations found in the config file")
             return False
         
         success_count = 0
         total_count = len(configs)
         
-        print(f"Found {total_count} video(s) to process in config file")
+        logger.info("Found %s video(s) to process in config file", total_count)
         
+        valid_configs = []
         for i, config in enumerate(configs):
-            print(f"\nProcessing video {i+1}/{total_count}")
-            try:
-                if not all(key in config for key in ['source', 'in', 'out', 'output']):
-                    missing_keys = [key for key in ['source', 'in', 'out', 'output'] if key not in config]
-                    print(f"Config #{i+1} is missing required parameters: {', '.join(missing_keys)}")
-                    continue
-                
-                if process_video(
-                    config['source'],
-                    config['in'],
-                    config['out'],
-                    config['output']
-                ):
-                    success_count += 1
-            except Exception as e:
-                print(f"Error processing config #{i+1}: {e}")
+            if not isinstance(config, dict):
+                logger.warning("Config #%s is not a JSON object", i+1)
+                continue
+            missing_keys = sorted(REQUIRED_KEYS - config.keys())
+            if missing_keys:
+                logger.warning("Config #%s is missing required parameters: %s", i+1, ', '.join(missing_keys))
+                continue
+            valid_configs.append((i, config))
+        
+        # Parallel jobs writing the same fixed output file would corrupt it, so only
+        # the last entry for each path runs, matching the old sequential behavior
+        last_writer = {}
+        for i, config in valid_configs:
+            fixed_path = _fixed_output_path(config['output'])
+            if fixed_path is not None:
+                last_writer[fixed_path] = i
         
-        print(f"\nBatch processing summary: Successfully processed {success_count} out of {total_count} videos")
+        # Group complete configs by source so their clips can share an ffmpeg process
+        groups = defaultdict(list)
+        for i, config in valid_configs:
+            fixed_path = _fixed_output_path(config['output'])
+            if fixed_path is not None and last_writer[fixed_path] != i:
+                logger.warning("Config #%s writes the same output as config #%s; skipping it",
+                               i+1, last_writer[fixed_path]+1)
+                continue
+            groups[os.path.abspath(config['source'])].append((i, config))
+        
+        if not groups:
+            logger.error("No valid configurations found in the config file")
+            return False
+        
+        # Split each source's clips into chunks of at most _MAX_CLIPS_PER_PROCESS
+        chunks = [
+            entries[start:start + _MAX_CLIPS_PER_PROCESS]
+            for entries in groups.values()
+            for start in range(0, len(entries), _MAX_CLIPS_PER_PROCESS)
+        ]
+        
+        # Submit each chunk to a bounded pool of workers
+        futures = {}
+        if jobs is None:
+            jobs = os.cpu_count() or 4
+        with ThreadPoolExecutor(max_workers=min(len(chunks), jobs)) as executor:
+            for entries in chunks:
+                indices = [i for i, _ in entries]
+                logger.info("\nQueueing %s clip(s) from %s", len(entries), entries[0][1]['source'])
+                if len(entries) == 1:
+                    config = entries[0][1]
+                    future = executor.submit(
+                        process_video,
+                        config['source'],
+                        config['in'],
+                        config['out'],
+                        config['output']
+                    )
+                else:
+                    future = executor.submit(
+                        process_source_clips,
+                        entries[0][1]['source'],
+                        [config for _, config in entries]
+                    )
+                futures[future] = indices
+            
+            for future in as_completed(futures):
+                indices = futures[future]
+                try:
+                    # process_video returns a bool, process_source_clips a count
+                    success_count += int(future.result())
+                except Exception as e:
+                    logger.error("Error processing config(s) %s: %s", ', '.join(f'#{i+1}' for i in indices), e)
+        
+        logger.info("\nBatch processing summary: Successfully processed %s out of %s videos", success_count, total_count)
         return success_count > 0
     except json.JSONDecodeError as e:
-        print(f"Error parsing config file: {e}")
-        print("Make sure the config file is valid JSON")
+        logger.error("Error parsing config file: %s", e)
+        logger.info("Make sure the config file is valid JSON")
         return False
     except Exception as e:
-        print(f"Error reading config file: {e}")
+        logger.error("Error reading config file: %s", e)
         return False
 
+def _positive_int(value):
+    """argparse type for options that need an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Crop video using FFMPEG based on timestamps')
     
@@ -245,75 +459,78 @@ def main():
     # Add explicit ffmpeg path option
     parser.add_argument('--ffmpeg-path', help='Path to ffmpeg executable, if not in system PATH')
     
+    # Number of videos to process concurrently in batch mode
+    parser.add_argument('--jobs', type=_positive_int, default=None,
+                        help='Number of videos to process in parallel with --config (default: CPU count)')
+    
+    # Show the ffmpeg commands being run
+    parser.add_argument('--verbose', action='store_true', help='Log the ffmpeg command line for each video')
+    
     args = parser.parse_args()
     
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
     # Check if explicit ffmpeg path is provided
     ffmpeg_cmd = 'ffmpeg'
     if hasattr(args, 'ffmpeg_path') and args.ffmpeg_path:
         ffmpeg_cmd = args.ffmpeg_path
-        print(f"Using provided ffmpeg path: {ffmpeg_cmd}")
+        logger.info("Using provided ffmpeg path: %s", ffmpeg_cmd)
     
     # Check if ffmpeg is available
-    system_ffmpeg = False
-    try:
-        result = subprocess.run([ffmpeg_cmd, '-version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode == 0:
-            print(f"Using system FFMPEG: {ffmpeg_cmd}")
-            system_ffmpeg = True
-        else:
-            print(f"FFMPEG check returned non-zero code: {result.returncode}")
-            print(f"STDERR: {result.stderr.decode('utf-8', errors='replace')}")
-    except Exception as e:
-        print(f"Error checking FFMPEG: {e}")
+    system_ffmpeg = _ffmpeg_available(ffmpeg_cmd)
+    if system_ffmpeg:
+        logger.info("Using system FFMPEG: %s", ffmpeg_cmd)
+    else:
+        logger.error("FFMPEG check failed for: %s", ffmpeg_cmd)
     
     if not system_ffmpeg:
-        if HAVE_FFMPEG_PYTHON:
-            print("System FFMPEG not found, using ffmpeg-python library")
+        if _get_ffmpeg_py() is not None:
+            logger.info("System FFMPEG not found, using ffmpeg-python library")
             # Check if ffmpeg-python can actually run
-            try:
-                print("Testing ffmpeg-python...")
-                ffmpeg.probe(r"C:\Projects\clip-project\qmSFWmA54IA.mp4")
-                print("ffmpeg-python can access ffmpeg")
-            except Exception as e:
-                print(f"ffmpeg-python test failed: {e}")
-                print("This suggests ffmpeg is not properly installed or not accessible to ffmpeg-python")
-                print("\nIMPORTANT: FFMPEG IS REQUIRED TO USE THIS SCRIPT")
-                print("Please install FFMPEG:")
-                print("- Windows: Download from https://ffmpeg.org/download.html and add to PATH")
-                print("- macOS: Use Homebrew: brew install ffmpeg")
-                print("- Linux: Use your package manager, e.g., apt install ffmpeg")
-                print("\nAfter installing, make sure the ffmpeg command is in your system PATH")
-                print("or use the --ffmpeg-path argument to specify the location of the ffmpeg executable.")
-                print("\nFor more information, visit: https://ffmpeg.org/download.html\n")
+            logger.info("Testing ffmpeg-python...")
+            if _get_ffmpeg_py().probe_works():
+                logger.info("ffmpeg-python can access ffmpeg")
+            else:
+                logger.error("ffmpeg-python test failed")
+                logger.info("This suggests ffmpeg is not properly installed or not accessible to ffmpeg-python")
+                logger.info("\nIMPORTANT: FFMPEG IS REQUIRED TO USE THIS SCRIPT")
+                logger.info("Please install FFMPEG:")
+                logger.info("- Windows: Download from https://ffmpeg.org/download.html and add to PATH")
+                logger.info("- macOS: Use Homebrew: brew install ffmpeg")
+                logger.info("- Linux: Use your package manager, e.g., apt install ffmpeg")
+                logger.info("\nAfter installing, make sure the ffmpeg command is in your system PATH")
+                logger.info("or use the --ffmpeg-path argument to specify the location of the ffmpeg executable.")
+                logger.info("\nFor more information, visit: https://ffmpeg.org/download.html\n")
                 return 1
         else:
-            print("Error: FFMPEG is not installed and ffmpeg-python library is not available")
+            logger.error("Error: FFMPEG is not installed and ffmpeg-python library is not available")
             return 1
     
     # Process based on arguments
     if args.config:
-        print(f"Starting batch processing with config: {args.config}")
+        logger.info("Starting batch processing with config: %s", args.config)
         if not os.path.exists(args.config):
-            print(f"Error: Config file not found: {args.config}")
+            logger.error("Error: Config file not found: %s", args.config)
             return 1
         
-        success = process_batch(args.config)
+        success = process_batch(args.config, jobs=args.jobs)
         if success:
-            print("Batch processing completed successfully")
+            logger.info("Batch processing completed successfully")
         else:
-            print("Batch processing completed with errors")
+            logger.info("Batch processing completed with errors")
         return 0 if success else 1
     else:
-        print(f"Processing single video: {args.source}")
+        logger.info("Processing single video: %s", args.source)
         # Check required arguments for single video processing
         if not args.in_timestamp:
-            print("Error: --in is required when not using --config")
+            logger.error("Error: --in is required when not using --config")
             return 1
         if not args.out_timestamp:
-            print("Error: --out is required when not using --config")
+            logger.error("Error: --out is required when not using --config")
             return 1
         if not args.output:
-            print("Error: --output is required when not using --config")
+            logger.error("Error: --output is required when not using --config")
             return 1
         
         # Process single video
@@ -325,13 +542,27 @@ def main():
                 args.output
             )
             if success:
-                print("Video processing completed successfully")
+                logger.info("Video processing completed successfully")
             else:
-                print("Video processing completed with errors")
+                logger.info("Video processing completed with errors")
             return 0 if success else 1
         except Exception as e:
-            print(f"Error: {e}")
+            logger.error("Error: %s", e)
             return 1
 
+def _start_logging():
+    """Send log records through a queue drained to stdout by a background thread."""
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, format='%(message)s',
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
 if __name__ == "__main__":
-    sys.exit(main())
+    listener = _start_logging()
+    try:
+        exit_code = main()
+    finally:
+        listener.stop()
+    sys.exit(exit_code)